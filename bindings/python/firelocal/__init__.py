@@ -4,7 +4,20 @@ FireLocal Python Bindings
 Offline-first database with Firestore API compatibility
 """
 
-from .core import FireLocal, WriteBatch, CompactionStats
+import platform
+
+try:
+    # Native PyO3 extension, built from native/ when a Rust toolchain is present
+    from ._firelocal_native import FireLocal, WriteBatch, CompactionStats
+except ImportError:
+    if platform.python_implementation() == "PyPy":
+        try:
+            # CFFI calls are JIT-inlined on PyPy, where the native extension is unavailable
+            from ._cffi_impl import FireLocal, WriteBatch, CompactionStats
+        except ImportError:
+            from .core import FireLocal, WriteBatch, CompactionStats
+    else:
+        from .core import FireLocal, WriteBatch, CompactionStats
 from .field_value import (
     server_timestamp,
     increment,
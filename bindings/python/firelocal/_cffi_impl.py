@@ -0,0 +1,334 @@
+"""
+FireLocal Python bindings using CFFI
+
+Used when the native extension is unavailable, most notably on PyPy where
+the JIT inlines CFFI calls that would otherwise go through ctypes.
+"""
+
+from typing import Optional, Dict, Any, Iterable, List, Sequence, Tuple, Union
+
+from cffi import FFI
+
+from ._json import encode_document as _encode_document, loads_buffer as _loads_buffer
+from .core import (
+    _decode_multi_get,
+    _enc,
+    _encode_lengths,
+    _encode_set_frames,
+    _get_library_path,
+    CompactionStats,
+    WriteBatch as _CtypesWriteBatch,
+)
+
+ffi = FFI()
+ffi.cdef("""
+    typedef struct {
+        uint64_t files_before;
+        uint64_t files_after;
+        uint64_t entries_before;
+        uint64_t entries_after;
+        uint64_t tombstones_removed;
+        uint64_t size_before;
+        uint64_t size_after;
+    } CompactionStatsC;
+
+    void *firelocal_open(const char *path);
+    void firelocal_destroy(void *db);
+    int firelocal_load_rules(void *db, const char *rules);
+    int firelocal_put_resource(void *db, const char *key, const char *val);
+    char *firelocal_get_resource_len(void *db, const char *key, size_t *out_len);
+    int firelocal_put_bytes(void *db, const char *key, const uint8_t *data, size_t len);
+    uint8_t *firelocal_get_bytes(void *db, const char *key, size_t *out_len);
+    uint8_t *firelocal_get_field(void *db, const char *key, const uint8_t *path, size_t path_len,
+                                 size_t *out_len);
+    uint8_t *firelocal_multi_get(void *db, const uint8_t *keys, size_t len, size_t *out_len);
+    int firelocal_multi_put(void *db, const uint8_t *buf, size_t buf_len, uint32_t count);
+    void firelocal_free_buffer(uint8_t *buf, size_t len);
+    int firelocal_delete(void *db, const char *key);
+    void firelocal_free_string(char *s);
+    int firelocal_batch_commit_ops(void *db, const uint8_t *buf, size_t len);
+    int firelocal_compact_struct(void *db, CompactionStatsC *out);
+    int firelocal_flush(void *db);
+""")
+
+# Every function declared above, resolved eagerly by _load_library
+_SYMBOLS = (
+    "firelocal_open",
+    "firelocal_destroy",
+    "firelocal_load_rules",
+    "firelocal_put_resource",
+    "firelocal_get_resource_len",
+    "firelocal_put_bytes",
+    "firelocal_get_bytes",
+    "firelocal_get_field",
+    "firelocal_multi_get",
+    "firelocal_multi_put",
+    "firelocal_free_buffer",
+    "firelocal_delete",
+    "firelocal_free_string",
+    "firelocal_batch_commit_ops",
+    "firelocal_compact_struct",
+    "firelocal_flush",
+)
+
+_lib = None
+
+
+def _load_library():
+    """Open the core library on first use"""
+    global _lib
+    if _lib is None:
+        lib = ffi.dlopen(_get_library_path())
+        # ABI mode looks symbols up lazily; touch them all so a library missing
+        # one fails here, like the ctypes bindings, instead of on first use
+        for name in _SYMBOLS:
+            getattr(lib, name)
+        _lib = lib
+    return _lib
+
+
+class FireLocal:
+    """
+    FireLocal database instance
+
+    Same API as the ctypes bindings in `firelocal.core`.
+    """
+
+    def __init__(self, path: str):
+        """
+        Create a new FireLocal instance
+
+        Args:
+            path: Directory path for database storage
+        """
+        self._handle = ffi.NULL
+        try:
+            _load_library()
+        except (OSError, AttributeError) as e:
+            # AttributeError: an older library missing one of the declared symbols
+            raise RuntimeError(f"FireLocal library not loaded: {e}") from e
+
+        self.path = path
+        self._handle = _lib.firelocal_open(path.encode('utf-8'))
+        if self._handle == ffi.NULL:
+            raise RuntimeError(f"Failed to open database at {path}")
+
+    def load_rules(self, rules: str) -> None:
+        """Load security rules"""
+        if _lib.firelocal_load_rules(self._handle, rules.encode('utf-8')) != 0:
+            raise RuntimeError("Failed to load rules")
+
+    def put(self, key: Union[str, bytes], value: Dict[str, Any]) -> None:
+        """
+        Write a document
+
+        Args:
+            key: Document path (e.g., "users/alice"), as str or UTF-8 bytes
+            value: Document data as dictionary, or JSON bytes stored as-is
+        """
+        if _lib.firelocal_put_resource(self._handle, _enc(key), _encode_document(value)) != 0:
+            raise RuntimeError(f"Failed to put document: {key}")
+
+    def get(self, key: Union[str, bytes]) -> Optional[Dict[str, Any]]:
+        """
+        Read a document
+
+        Args:
+            key: Document path
+
+        Returns:
+            Document data or None if not found
+        """
+        length = ffi.new("size_t *")
+        result_ptr = _lib.firelocal_get_resource_len(self._handle, _enc(key), length)
+        if result_ptr == ffi.NULL:
+            return None
+
+        try:
+            return _loads_buffer(memoryview(ffi.buffer(result_ptr, length[0])))
+        finally:
+            _lib.firelocal_free_string(result_ptr)
+
+    def get_field(self, key: Union[str, bytes], path: Sequence[str]) -> Any:
+        """
+        Read one field of a document without decoding the rest of it
+
+        Args:
+            key: Document path
+            path: Field names leading to the value; numeric strings index into arrays
+
+        Returns:
+            Field value, or None if the document or field does not exist; a field
+            holding null also returns None
+        """
+        if isinstance(path, (str, bytes)):
+            raise TypeError("path must be a sequence of field names, not a single string")
+
+        request = _encode_lengths(segment.encode('utf-8') for segment in path)
+
+        out_len = ffi.new("size_t *")
+        result_ptr = _lib.firelocal_get_field(
+            self._handle, _enc(key), ffi.from_buffer("uint8_t[]", request), len(request), out_len
+        )
+        if result_ptr == ffi.NULL:
+            return None
+
+        try:
+            return _loads_buffer(memoryview(ffi.buffer(result_ptr, out_len[0])))
+        finally:
+            _lib.firelocal_free_buffer(result_ptr, out_len[0])
+
+    def put_bytes(self, key: Union[str, bytes], blob: bytes) -> None:
+        """
+        Write an opaque value without JSON encoding it
+
+        Args:
+            key: Document path
+            blob: Value stored verbatim
+        """
+        data = ffi.from_buffer("uint8_t[]", blob)
+        if _lib.firelocal_put_bytes(self._handle, _enc(key), data, len(blob)) != 0:
+            raise RuntimeError(f"Failed to put bytes: {key}")
+
+    def get_bytes(self, key: Union[str, bytes]) -> Optional[bytes]:
+        """
+        Read a value without JSON decoding it
+
+        Args:
+            key: Document path
+
+        Returns:
+            Stored bytes or None if not found
+        """
+        length = ffi.new("size_t *")
+        result_ptr = _lib.firelocal_get_bytes(self._handle, _enc(key), length)
+        if result_ptr == ffi.NULL:
+            return None
+
+        try:
+            return ffi.buffer(result_ptr, length[0])[:]
+        finally:
+            _lib.firelocal_free_buffer(result_ptr, length[0])
+
+    def multi_get(self, keys: List[Union[str, bytes]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Read several documents with a single call into the core
+
+        Args:
+            keys: Document paths
+
+        Returns:
+            Document data for each key, in order, with None for missing documents
+        """
+        request = _encode_lengths(_enc(key) for key in keys)
+
+        out_len = ffi.new("size_t *")
+        result_ptr = _lib.firelocal_multi_get(
+            self._handle, ffi.from_buffer("uint8_t[]", request), len(request), out_len
+        )
+        if result_ptr == ffi.NULL:
+            raise RuntimeError("Failed to read documents")
+
+        try:
+            return _decode_multi_get(memoryview(ffi.buffer(result_ptr, out_len[0])), len(keys))
+        finally:
+            _lib.firelocal_free_buffer(result_ptr, out_len[0])
+
+    def multi_put(self, items: Iterable[Tuple[Union[str, bytes], Dict[str, Any]]]) -> None:
+        """
+        Write several documents with a single call into the core
+
+        Args:
+            items: (document path, document data or JSON bytes) pairs
+        """
+        request, count = _encode_set_frames(items)
+
+        result = _lib.firelocal_multi_put(
+            self._handle, ffi.from_buffer("uint8_t[]", request), len(request), count
+        )
+        if result != 0:
+            raise RuntimeError("Failed to put documents")
+
+    def delete(self, key: Union[str, bytes]) -> None:
+        """
+        Delete a document
+
+        Args:
+            key: Document path
+        """
+        if _lib.firelocal_delete(self._handle, _enc(key)) != 0:
+            raise RuntimeError(f"Failed to delete document: {key}")
+
+    def batch(self) -> 'WriteBatch':
+        """
+        Create a new write batch
+
+        Returns:
+            WriteBatch instance
+        """
+        return WriteBatch(self)
+
+    def compact(self) -> CompactionStats:
+        """
+        Run compaction to merge SST files and remove tombstones
+
+        Returns:
+            CompactionStats with before/after metrics
+        """
+        stats = ffi.new("CompactionStatsC *")
+        if _lib.firelocal_compact_struct(self._handle, stats) != 0:
+            raise RuntimeError("Compaction failed")
+
+        return CompactionStats(
+            files_before=stats.files_before,
+            files_after=stats.files_after,
+            entries_before=stats.entries_before,
+            entries_after=stats.entries_after,
+            tombstones_removed=stats.tombstones_removed,
+            size_before=stats.size_before,
+            size_after=stats.size_after,
+        )
+
+    def flush(self) -> None:
+        """Flush memtable to SST file"""
+        if _lib.firelocal_flush(self._handle) != 0:
+            raise RuntimeError("Flush failed")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Close the database and free resources"""
+        if self._handle != ffi.NULL:
+            _lib.firelocal_destroy(self._handle)
+            self._handle = ffi.NULL
+
+    def __del__(self):
+        self.close()
+
+
+class WriteBatch(_CtypesWriteBatch):
+    """
+    Atomic write batch
+
+    Encodes operations like the ctypes batch and commits them through CFFI.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, db: FireLocal):
+        self.db = db
+        self._buf = bytearray()
+        self._count = 0
+        self._commit = _lib.firelocal_batch_commit_ops
+
+    def commit(self) -> None:
+        """Commit the batch atomically"""
+        buf = ffi.from_buffer("uint8_t[]", self._buf)
+        result = self._commit(self.db._handle, buf, len(self._buf))
+        ffi.release(buf)  # release the buffer export so the batch can keep growing
+        if result != 0:
+            raise RuntimeError("Failed to commit batch")
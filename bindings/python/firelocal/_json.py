@@ -0,0 +1,70 @@
+"""
+Document JSON encoding shared by the ctypes and native bindings
+"""
+
+import json
+import math
+from typing import Any
+
+# Prefer orjson for document (de)serialization, fall back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _stdlib_dumps(value: Any) -> bytes:
+    return json.dumps(value).encode('utf-8')
+
+
+def _has_non_finite(value: Any) -> bool:
+    """Whether `value` contains NaN or an infinity, which orjson writes as null"""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(v) for v in value)
+    return False
+
+
+if orjson is not None:
+    def dumps(value: Any) -> bytes:
+        try:
+            # Non-str keys are stringified like stdlib json does
+            encoded = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # orjson rejects some values stdlib json accepts, e.g. integers over 64 bits
+            return _stdlib_dumps(value)
+        # Keep NaN and infinities as stdlib json writes them instead of null
+        if b"null" in encoded and _has_non_finite(value):
+            return _stdlib_dumps(value)
+        return encoded
+
+    def loads(data: bytes) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Documents written by stdlib json may contain NaN or Infinity
+            return json.loads(data)
+
+    def loads_buffer(buf: memoryview) -> Any:
+        # orjson parses buffers such as memoryview without copying them first
+        try:
+            return orjson.loads(buf)
+        except orjson.JSONDecodeError:
+            return json.loads(bytes(buf))
+else:
+    dumps = _stdlib_dumps
+
+    # json.loads accepts UTF-8 bytes directly
+    loads = json.loads
+
+    def loads_buffer(buf: memoryview) -> Any:
+        return json.loads(bytes(buf))
+
+def encode_document(value: Any) -> bytes:
+    """Encode a document for the core; `bytes` are taken as already-serialized JSON"""
+    if isinstance(value, bytes):
+        return value
+    return dumps(value)
@@ -3,32 +3,122 @@ Core FireLocal Python bindings using ctypes
 """
 
 import ctypes
-import json
+import functools
 import os
 import platform
+import struct
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterable, List, Sequence, Tuple, Union
 
+from ._json import encode_document as _encode_document, loads_buffer as _loads_buffer
 
-def _get_library_path():
-    """Find the FireLocal core library"""
+
+def _enc(key: Union[str, bytes]) -> bytes:
+    """Encode a document path, passing already-encoded bytes through"""
+    return key if isinstance(key, bytes) else key.encode('utf-8')
+
+
+def _view(ptr: int, size: int) -> memoryview:
+    """Borrow `size` bytes at `ptr` without copying; only valid until the buffer is freed"""
+    return memoryview((ctypes.c_ubyte * size).from_address(ptr))
+
+
+# Operation tags for the framed batch encoding, mirroring firelocal_core::transaction
+_BATCH_OP_SET = 0
+_BATCH_OP_UPDATE = 1
+_BATCH_OP_DELETE = 2
+
+# Frame header: op (u8), path length (u32 LE), data length (u32 LE)
+_FRAME_HDR = struct.Struct('<BII')
+_FRAME_HDR_PLACEHOLDER = bytes(_FRAME_HDR.size)
+
+# Length prefix used by firelocal_multi_get, and its marker for missing documents
+_U32 = struct.Struct('<I')
+_MULTI_GET_MISSING = 0xFFFFFFFF
+
+
+def _encode_lengths(items: Iterable[bytes]) -> bytearray:
+    """Encode `[len u32][bytes]` entries, the list format taken by multi_get and get_field"""
+    request = bytearray()
+    for item in items:
+        request += _U32.pack(len(item))
+        request += item
+    return request
+
+
+def _encode_set_frames(items: Iterable[Tuple[Union[str, bytes], Any]]) -> Tuple[bytearray, int]:
+    """Encode (path, document) pairs as set frames for multi_put, returning the buffer and count"""
+    request = bytearray()
+    count = 0
+    for key, value in items:
+        encoded_key = _enc(key)
+        payload = _encode_document(value)
+        offset = len(request)
+        request += _FRAME_HDR_PLACEHOLDER
+        _FRAME_HDR.pack_into(request, offset, _BATCH_OP_SET, len(encoded_key), len(payload))
+        request += encoded_key
+        request += payload
+        count += 1
+    return request, count
+
+
+def _decode_multi_get(raw: memoryview, count: int) -> List[Optional[Dict[str, Any]]]:
+    """Decode the `count` length-prefixed documents returned by firelocal_multi_get"""
+    docs = []
+    offset = 0
+    for _ in range(count):
+        (length,) = _U32.unpack_from(raw, offset)
+        offset += 4
+        if length == _MULTI_GET_MISSING:
+            docs.append(None)
+        else:
+            docs.append(_loads_buffer(raw[offset:offset + length]))
+            offset += length
+    return docs
+
+
+def _library_name() -> str:
     system = platform.system()
     if system == "Windows":
-        lib_name = "firelocal_core.dll"
-    elif system == "Darwin":
-        lib_name = "libfirelocal_core.dylib"
-    else:
-        lib_name = "libfirelocal_core.so"
-    
-    # Try to find in standard locations
-    search_paths = [
-        Path(__file__).parent.parent.parent.parent / "target" / "release",
-        Path(__file__).parent.parent.parent.parent / "target" / "debug",
+        return "firelocal_core.dll"
+    if system == "Darwin":
+        return "libfirelocal_core.dylib"
+    return "libfirelocal_core.so"
+
+
+def _search_paths() -> List[Path]:
+    """Standard locations checked when no library is bundled"""
+    workspace = Path(__file__).parent.parent.parent.parent
+    return [
+        workspace / "target" / "release",
+        workspace / "target" / "debug",
         Path("/usr/local/lib"),
         Path("/usr/lib"),
     ]
+
+
+@functools.lru_cache(maxsize=None)
+def _get_library_path():
+    """
+    Find the FireLocal core library
+    
+    Checks the FIRELOCAL_LIB environment variable, then the library bundled
+    next to this module in installed wheels, then the standard search
+    locations used by source checkouts.
+    """
+    env_path = os.environ.get("FIRELOCAL_LIB")
+    if env_path:
+        return env_path
+    
+    lib_name = _library_name()
+    
+    # Wheels ship the library inside the package, matching this build
+    bundled = Path(__file__).parent / lib_name
+    if bundled.exists():
+        return str(bundled)
     
-    for path in search_paths:
+    # Try to find in standard locations
+    for path in _search_paths():
         lib_path = path / lib_name
         if lib_path.exists():
             return str(lib_path)
@@ -36,61 +126,100 @@ def _get_library_path():
     raise FileNotFoundError(f"Could not find {lib_name}")
 
 
-# Load the library
-try:
-    _lib = ctypes.CDLL(_get_library_path())
-    
-    # Define function signatures
-    _lib.firelocal_open.argtypes = [ctypes.c_char_p]
-    _lib.firelocal_open.restype = ctypes.c_void_p
-    
-    _lib.firelocal_destroy.argtypes = [ctypes.c_void_p]
-    _lib.firelocal_destroy.restype = None
-    
-    _lib.firelocal_load_rules.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
-    _lib.firelocal_load_rules.restype = ctypes.c_int
-    
-    _lib.firelocal_put_resource.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p]
-    _lib.firelocal_put_resource.restype = ctypes.c_int
-    
-    _lib.firelocal_get_resource.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
-    _lib.firelocal_get_resource.restype = ctypes.c_void_p
-    
-    _lib.firelocal_delete.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
-    _lib.firelocal_delete.restype = ctypes.c_int
-    
-    _lib.firelocal_free_string.argtypes = [ctypes.c_void_p]
-    _lib.firelocal_free_string.restype = None
-    
-    _lib.firelocal_batch_new.argtypes = [ctypes.c_void_p]
-    _lib.firelocal_batch_new.restype = ctypes.c_void_p
-    
-    _lib.firelocal_batch_set.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p]
-    _lib.firelocal_batch_set.restype = ctypes.c_int
-    
-    _lib.firelocal_batch_update.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p]
-    _lib.firelocal_batch_update.restype = ctypes.c_int
-    
-    _lib.firelocal_batch_delete.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
-    _lib.firelocal_batch_delete.restype = ctypes.c_int
-    
-    _lib.firelocal_batch_commit.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
-    _lib.firelocal_batch_commit.restype = ctypes.c_int
-    
-    _lib.firelocal_batch_free.argtypes = [ctypes.c_void_p]
-    _lib.firelocal_batch_free.restype = None
-    
-    _lib.firelocal_compact.argtypes = [ctypes.c_void_p]
-    _lib.firelocal_compact.restype = ctypes.c_void_p
-    
-    _lib.firelocal_flush.argtypes = [ctypes.c_void_p]
-    _lib.firelocal_flush.restype = ctypes.c_int
-    
-    _LIB_LOADED = True
-except (OSError, FileNotFoundError) as e:
-    _LIB_LOADED = False
-    _lib = None
-    print(f"Warning: Could not load FireLocal library: {e}")
+class _CompactionStatsC(ctypes.Structure):
+    """Mirror of firelocal_core::ffi::CompactionStatsC"""
+    _fields_ = [
+        ("files_before", ctypes.c_uint64),
+        ("files_after", ctypes.c_uint64),
+        ("entries_before", ctypes.c_uint64),
+        ("entries_after", ctypes.c_uint64),
+        ("tombstones_removed", ctypes.c_uint64),
+        ("size_before", ctypes.c_uint64),
+        ("size_after", ctypes.c_uint64),
+    ]
+
+
+_lib = None
+
+
+def _load_library():
+    """Load the core library and define FFI signatures on first use"""
+    global _lib
+    if _lib is None:
+        lib = ctypes.CDLL(_get_library_path())
+        
+        # Define function signatures
+        lib.firelocal_open.argtypes = [ctypes.c_char_p]
+        lib.firelocal_open.restype = ctypes.c_void_p
+        
+        lib.firelocal_destroy.argtypes = [ctypes.c_void_p]
+        lib.firelocal_destroy.restype = None
+        
+        lib.firelocal_load_rules.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+        lib.firelocal_load_rules.restype = ctypes.c_int
+        
+        lib.firelocal_put_resource.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p]
+        lib.firelocal_put_resource.restype = ctypes.c_int
+        
+        lib.firelocal_get_resource.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+        lib.firelocal_get_resource.restype = ctypes.c_void_p
+        
+        lib.firelocal_get_resource_len.argtypes = [
+            ctypes.c_void_p, ctypes.c_char_p, ctypes.POINTER(ctypes.c_size_t)
+        ]
+        lib.firelocal_get_resource_len.restype = ctypes.c_void_p
+        
+        lib.firelocal_multi_get.argtypes = [
+            ctypes.c_void_p, ctypes.POINTER(ctypes.c_ubyte), ctypes.c_size_t,
+            ctypes.POINTER(ctypes.c_size_t)
+        ]
+        lib.firelocal_multi_get.restype = ctypes.c_void_p
+        
+        lib.firelocal_free_buffer.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+        lib.firelocal_free_buffer.restype = None
+        
+        lib.firelocal_delete.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+        lib.firelocal_delete.restype = ctypes.c_int
+        
+        lib.firelocal_free_string.argtypes = [ctypes.c_void_p]
+        lib.firelocal_free_string.restype = None
+        
+        lib.firelocal_batch_commit_ops.argtypes = [
+            ctypes.c_void_p, ctypes.POINTER(ctypes.c_ubyte), ctypes.c_size_t
+        ]
+        lib.firelocal_batch_commit_ops.restype = ctypes.c_int
+        
+        lib.firelocal_put_bytes.argtypes = [
+            ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_size_t
+        ]
+        lib.firelocal_put_bytes.restype = ctypes.c_int
+        
+        lib.firelocal_get_bytes.argtypes = [
+            ctypes.c_void_p, ctypes.c_char_p, ctypes.POINTER(ctypes.c_size_t)
+        ]
+        lib.firelocal_get_bytes.restype = ctypes.c_void_p
+        
+        lib.firelocal_get_field.argtypes = [
+            ctypes.c_void_p, ctypes.c_char_p, ctypes.POINTER(ctypes.c_ubyte), ctypes.c_size_t,
+            ctypes.POINTER(ctypes.c_size_t)
+        ]
+        lib.firelocal_get_field.restype = ctypes.c_void_p
+        
+        lib.firelocal_multi_put.argtypes = [
+            ctypes.c_void_p, ctypes.POINTER(ctypes.c_ubyte), ctypes.c_size_t, ctypes.c_uint32
+        ]
+        lib.firelocal_multi_put.restype = ctypes.c_int
+        
+        lib.firelocal_compact_struct.argtypes = [
+            ctypes.c_void_p, ctypes.POINTER(_CompactionStatsC)
+        ]
+        lib.firelocal_compact_struct.restype = ctypes.c_int
+        
+        lib.firelocal_flush.argtypes = [ctypes.c_void_p]
+        lib.firelocal_flush.restype = ctypes.c_int
+        
+        _lib = lib
+    return _lib
 
 
 class FireLocal:
@@ -112,37 +241,41 @@ class FireLocal:
         Args:
             path: Directory path for database storage
         """
-        if not _LIB_LOADED:
-            raise RuntimeError("FireLocal library not loaded")
+        self._handle = None
+        try:
+            _load_library()
+        except (OSError, AttributeError) as e:
+            # AttributeError: an older library missing one of the bound symbols
+            raise RuntimeError(f"FireLocal library not loaded: {e}") from e
             
         self.path = path
         self._handle = _lib.firelocal_open(path.encode('utf-8'))
         if not self._handle:
             raise RuntimeError(f"Failed to open database at {path}")
+        
+        # Bind hot-path FFI functions once to skip global/attribute lookups per call
+        self._put = _lib.firelocal_put_resource
+        self._get = _lib.firelocal_get_resource_len
+        self._del = _lib.firelocal_delete
+        self._free = _lib.firelocal_free_string
     
     def load_rules(self, rules: str) -> None:
         """Load security rules"""
         if _lib.firelocal_load_rules(self._handle, rules.encode('utf-8')) != 0:
             raise RuntimeError("Failed to load rules")
     
-    def put(self, key: str, value: Dict[str, Any]) -> None:
+    def put(self, key: Union[str, bytes], value: Dict[str, Any]) -> None:
         """
         Write a document
         
         Args:
-            key: Document path (e.g., "users/alice")
-            value: Document data as dictionary
+            key: Document path (e.g., "users/alice"), as str or UTF-8 bytes
+            value: Document data as dictionary, or JSON bytes stored as-is
         """
-        json_str = json.dumps(value)
-        result = _lib.firelocal_put_resource(
-            self._handle,
-            key.encode('utf-8'),
-            json_str.encode('utf-8')
-        )
-        if result != 0:
+        if self._put(self._handle, _enc(key), _encode_document(value)) != 0:
             raise RuntimeError(f"Failed to put document: {key}")
     
-    def get(self, key: str) -> Optional[Dict[str, Any]]:
+    def get(self, key: Union[str, bytes]) -> Optional[Dict[str, Any]]:
         """
         Read a document
         
@@ -152,25 +285,131 @@ class FireLocal:
         Returns:
             Document data or None if not found
         """
-        result_ptr = _lib.firelocal_get_resource(self._handle, key.encode('utf-8'))
+        length = ctypes.c_size_t(0)
+        result_ptr = self._get(self._handle, _enc(key), ctypes.byref(length))
         if not result_ptr:
             return None
         
         try:
-            json_str = ctypes.c_char_p(result_ptr).value.decode('utf-8')
-            return json.loads(json_str)
+            return _loads_buffer(_view(result_ptr, length.value))
         finally:
-            _lib.firelocal_free_string(result_ptr)
+            self._free(result_ptr)
     
-    def delete(self, key: str) -> None:
+    def get_field(self, key: Union[str, bytes], path: Sequence[str]) -> Any:
         """
-        Delete a document
+        Read one field of a document without decoding the rest of it
         
         Args:
             key: Document path
+            path: Field names leading to the value, e.g. ["user", "profile", "name"];
+                numeric strings index into arrays
+            
+        Returns:
+            Field value, or None if the document or field does not exist; a field
+            holding null also returns None
+        """
+        if isinstance(path, (str, bytes)):
+            raise TypeError("path must be a sequence of field names, not a single string")
+        
+        request = _encode_lengths(segment.encode('utf-8') for segment in path)
+        
+        size = len(request)
+        buf = (ctypes.c_ubyte * size).from_buffer(request)
+        out_len = ctypes.c_size_t(0)
+        result_ptr = _lib.firelocal_get_field(
+            self._handle, _enc(key), buf, size, ctypes.byref(out_len)
+        )
+        del buf
+        if not result_ptr:
+            return None
+        
+        try:
+            return _loads_buffer(_view(result_ptr, out_len.value))
+        finally:
+            _lib.firelocal_free_buffer(result_ptr, out_len.value)
+    
+    def put_bytes(self, key: Union[str, bytes], blob: bytes) -> None:
+        """
+        Write an opaque value without JSON encoding it
+        
+        Args:
+            key: Document path
+            blob: Value stored verbatim
+        """
+        if _lib.firelocal_put_bytes(self._handle, _enc(key), blob, len(blob)) != 0:
+            raise RuntimeError(f"Failed to put bytes: {key}")
+    
+    def get_bytes(self, key: Union[str, bytes]) -> Optional[bytes]:
+        """
+        Read a value without JSON decoding it
+        
+        Args:
+            key: Document path
+            
+        Returns:
+            Stored bytes or None if not found
+        """
+        length = ctypes.c_size_t(0)
+        result_ptr = _lib.firelocal_get_bytes(self._handle, _enc(key), ctypes.byref(length))
+        if not result_ptr:
+            return None
+        
+        try:
+            return ctypes.string_at(result_ptr, length.value)
+        finally:
+            _lib.firelocal_free_buffer(result_ptr, length.value)
+    
+    def multi_get(self, keys: List[Union[str, bytes]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Read several documents with a single call into the core
+        
+        Args:
+            keys: Document paths
+            
+        Returns:
+            Document data for each key, in order, with None for missing documents
         """
-        result = _lib.firelocal_delete(self._handle, key.encode('utf-8'))
+        request = _encode_lengths(_enc(key) for key in keys)
+        
+        size = len(request)
+        buf = (ctypes.c_ubyte * size).from_buffer(request)
+        out_len = ctypes.c_size_t(0)
+        result_ptr = _lib.firelocal_multi_get(self._handle, buf, size, ctypes.byref(out_len))
+        del buf
+        if not result_ptr:
+            raise RuntimeError("Failed to read documents")
+        
+        try:
+            return _decode_multi_get(_view(result_ptr, out_len.value), len(keys))
+        finally:
+            _lib.firelocal_free_buffer(result_ptr, out_len.value)
+    
+    def multi_put(self, items: Iterable[Tuple[Union[str, bytes], Dict[str, Any]]]) -> None:
+        """
+        Write several documents with a single call into the core
+        
+        The documents are appended to the WAL together and synced once.
+        
+        Args:
+            items: (document path, document data or JSON bytes) pairs
+        """
+        request, count = _encode_set_frames(items)
+        
+        size = len(request)
+        buf = (ctypes.c_ubyte * size).from_buffer(request)
+        result = _lib.firelocal_multi_put(self._handle, buf, size, count)
+        del buf
         if result != 0:
+            raise RuntimeError("Failed to put documents")
+    
+    def delete(self, key: Union[str, bytes]) -> None:
+        """
+        Delete a document
+        
+        Args:
+            key: Document path
+        """
+        if self._del(self._handle, _enc(key)) != 0:
             raise RuntimeError(f"Failed to delete document: {key}")
     
     def batch(self) -> 'WriteBatch':
@@ -189,24 +428,19 @@ class FireLocal:
         Returns:
             CompactionStats with before/after metrics
         """
-        result_ptr = _lib.firelocal_compact(self._handle)
-        if not result_ptr:
+        stats = _CompactionStatsC()
+        if _lib.firelocal_compact_struct(self._handle, ctypes.byref(stats)) != 0:
             raise RuntimeError("Compaction failed")
         
-        try:
-            json_str = ctypes.c_char_p(result_ptr).value.decode('utf-8')
-            data = json.loads(json_str)
-            return CompactionStats(
-                files_before=data['files_before'],
-                files_after=data['files_after'],
-                entries_before=data['entries_before'],
-                entries_after=data['entries_after'],
-                tombstones_removed=data['tombstones_removed'],
-                size_before=data['size_before'],
-                size_after=data['size_after'],
-            )
-        finally:
-            _lib.firelocal_free_string(result_ptr)
+        return CompactionStats(
+            files_before=stats.files_before,
+            files_after=stats.files_after,
+            entries_before=stats.entries_before,
+            entries_after=stats.entries_after,
+            tombstones_removed=stats.tombstones_removed,
+            size_before=stats.size_before,
+            size_after=stats.size_after,
+        )
     
     def flush(self) -> None:
         """Flush memtable to SST file"""
@@ -234,6 +468,9 @@ class WriteBatch:
     """
     Atomic write batch
     
+    Operations are encoded into a single buffer and submitted to the core
+    with one FFI call on commit.
+    
     Example:
         >>> batch = db.batch()
         >>> batch.set("users/alice", {"name": "Alice"})
@@ -242,58 +479,62 @@ class WriteBatch:
         >>> batch.commit()
     """
     
+    __slots__ = ("db", "_buf", "_count", "_commit")
+    
     def __init__(self, db: FireLocal):
         self.db = db
-        self._handle = _lib.firelocal_batch_new(db._handle)
-        if not self._handle:
-            raise RuntimeError("Failed to create batch")
-    
-    def set(self, path: str, data: Dict[str, Any]) -> 'WriteBatch':
+        self._buf = bytearray()
+        self._count = 0
+        self._commit = _lib.firelocal_batch_commit_ops
+    
+    def _append(self, op: int, path: Union[str, bytes], payload: bytes = b'') -> None:
+        """Append one `[op][path_len][data_len][path][data]` frame"""
+        encoded_path = _enc(path)
+        buf = self._buf
+        offset = len(buf)
+        # Reserve the header and pack it in place, avoiding a temporary bytes object
+        buf += _FRAME_HDR_PLACEHOLDER
+        _FRAME_HDR.pack_into(buf, offset, op, len(encoded_path), len(payload))
+        buf += encoded_path
+        buf += payload
+        self._count += 1
+    
+    def set(self, path: Union[str, bytes], data: Dict[str, Any]) -> 'WriteBatch':
         """Add a set operation to the batch"""
-        json_str = json.dumps(data)
-        result = _lib.firelocal_batch_set(
-            self._handle,
-            path.encode('utf-8'),
-            json_str.encode('utf-8')
-        )
-        if result != 0:
-            raise RuntimeError(f"Failed to add set operation: {path}")
+        self._append(_BATCH_OP_SET, path, _encode_document(data))
         return self
     
-    def update(self, path: str, data: Dict[str, Any]) -> 'WriteBatch':
+    def update(self, path: Union[str, bytes], data: Dict[str, Any]) -> 'WriteBatch':
         """Add an update operation to the batch"""
-        json_str = json.dumps(data)
-        result = _lib.firelocal_batch_update(
-            self._handle,
-            path.encode('utf-8'),
-            json_str.encode('utf-8')
-        )
-        if result != 0:
-            raise RuntimeError(f"Failed to add update operation: {path}")
+        self._append(_BATCH_OP_UPDATE, path, _encode_document(data))
         return self
     
-    def delete(self, path: str) -> 'WriteBatch':
+    def delete(self, path: Union[str, bytes]) -> 'WriteBatch':
         """Add a delete operation to the batch"""
-        result = _lib.firelocal_batch_delete(self._handle, path.encode('utf-8'))
-        if result != 0:
-            raise RuntimeError(f"Failed to add delete operation: {path}")
+        self._append(_BATCH_OP_DELETE, path)
         return self
     
     def commit(self) -> None:
         """Commit the batch atomically"""
-        result = _lib.firelocal_batch_commit(self.db._handle, self._handle)
+        size = len(self._buf)
+        buf = (ctypes.c_ubyte * size).from_buffer(self._buf)
+        result = self._commit(self.db._handle, buf, size)
+        del buf  # release the buffer export so the batch can keep growing
         if result != 0:
             raise RuntimeError("Failed to commit batch")
     
-    def __del__(self):
-        if self._handle:
-            _lib.firelocal_batch_free(self._handle)
-            self._handle = None
+    def __len__(self) -> int:
+        return self._count
 
 
 class CompactionStats:
     """Statistics from a compaction run"""
     
+    __slots__ = (
+        "files_before", "files_after", "entries_before", "entries_after",
+        "tombstones_removed", "size_before", "size_after",
+    )
+    
     def __init__(self, files_before: int, files_after: int,
                  entries_before: int, entries_after: int,
                  tombstones_removed: int, size_before: int, size_after: int):
@@ -0,0 +1,384 @@
+use firelocal_core::transaction::WriteBatch as CoreWriteBatch;
+use firelocal_core::FireLocal as CoreFireLocal;
+use pyo3::exceptions::{PyRuntimeError, PyValueError};
+use pyo3::prelude::*;
+use pyo3::sync::GILOnceCell;
+use pyo3::types::{PyBytes, PyModule};
+use std::sync::{Arc, Mutex};
+
+type SharedDb = Arc<Mutex<Option<CoreFireLocal>>>;
+
+static JSON: GILOnceCell<Py<PyModule>> = GILOnceCell::new();
+
+/// `firelocal._json`, which encodes documents (including FieldValue sentinels)
+/// the same way as the ctypes bindings
+fn json_module(py: Python<'_>) -> PyResult<&Bound<'_, PyModule>> {
+    JSON.get_or_try_init(py, || {
+        PyModule::import_bound(py, "firelocal._json").map(Bound::unbind)
+    })
+    .map(|m| m.bind(py))
+}
+
+/// Convert a document value into the bytes stored by the core.
+///
+/// Mirrors `firelocal._json.encode_document`: `bytes` are passed through
+/// untouched, anything else is JSON encoded.
+fn to_document_bytes(value: &Bound<'_, PyAny>) -> PyResult<Vec<u8>> {
+    if let Ok(bytes) = value.downcast::<PyBytes>() {
+        return Ok(bytes.as_bytes().to_vec());
+    }
+    let encoded = json_module(value.py())?.call_method1("dumps", (value,))?;
+    Ok(encoded.downcast::<PyBytes>()?.as_bytes().to_vec())
+}
+
+/// Document path accepted as `str` or UTF-8 `bytes`
+struct DocPath(String);
+
+impl<'py> FromPyObject<'py> for DocPath {
+    fn extract_bound(ob: &Bound<'py, PyAny>) -> PyResult<Self> {
+        if let Ok(bytes) = ob.downcast::<PyBytes>() {
+            return std::str::from_utf8(bytes.as_bytes())
+                .map(|s| DocPath(s.to_owned()))
+                .map_err(|e| PyValueError::new_err(e.to_string()));
+        }
+        ob.extract().map(DocPath)
+    }
+}
+
+/// Run `f` against the open database.
+///
+/// Methods call this inside `py.allow_threads` so other Python threads keep
+/// running while the core blocks on disk I/O; the lock is taken without the GIL.
+fn with_db<R>(
+    db: &SharedDb,
+    f: impl FnOnce(&mut CoreFireLocal) -> Result<R, String>,
+) -> PyResult<R> {
+    let mut guard = db
+        .lock()
+        .map_err(|_| PyRuntimeError::new_err("Lock error"))?;
+    let db = guard
+        .as_mut()
+        .ok_or_else(|| PyRuntimeError::new_err("Database is closed"))?;
+    f(db).map_err(PyRuntimeError::new_err)
+}
+
+/// FireLocal database instance backed by the native core
+#[pyclass(module = "firelocal._firelocal_native")]
+pub struct FireLocal {
+    inner: SharedDb,
+    #[pyo3(get)]
+    path: String,
+}
+
+#[pymethods]
+impl FireLocal {
+    #[new]
+    fn new(path: String) -> PyResult<Self> {
+        let db = CoreFireLocal::new(&path).map_err(|e| {
+            PyRuntimeError::new_err(format!("Failed to open database at {}: {}", path, e))
+        })?;
+        Ok(FireLocal {
+            inner: Arc::new(Mutex::new(Some(db))),
+            path,
+        })
+    }
+
+    /// Load security rules
+    fn load_rules(&self, py: Python<'_>, rules: &str) -> PyResult<()> {
+        py.allow_threads(|| {
+            with_db(&self.inner, |db| {
+                db.load_rules(rules)
+                    .map_err(|e| format!("Failed to load rules: {}", e))
+            })
+        })
+    }
+
+    /// Write a document
+    fn put(&self, py: Python<'_>, key: DocPath, value: &Bound<'_, PyAny>) -> PyResult<()> {
+        let key = key.0;
+        let bytes = to_document_bytes(value)?;
+        py.allow_threads(|| {
+            with_db(&self.inner, |db| {
+                db.put(key.clone(), bytes)
+                    .map_err(|e| format!("Failed to put document: {}: {}", key, e))
+            })
+        })
+    }
+
+    /// Read a document, returning None if it does not exist
+    fn get(&self, py: Python<'_>, key: DocPath) -> PyResult<Option<PyObject>> {
+        let bytes =
+            py.allow_threads(|| with_db(&self.inner, |db| Ok(db.get(&key.0).ok().flatten())))?;
+        match bytes {
+            Some(bytes) => {
+                let raw = PyBytes::new_bound(py, &bytes);
+                Ok(Some(
+                    json_module(py)?.call_method1("loads", (raw,))?.unbind(),
+                ))
+            }
+            None => Ok(None),
+        }
+    }
+
+    /// Read one field of a document without decoding the rest of it,
+    /// returning None if the document or field does not exist or the field is
+    /// null. `path` must be a sequence of field names; a `str` is rejected.
+    fn get_field(
+        &self,
+        py: Python<'_>,
+        key: DocPath,
+        path: Vec<String>,
+    ) -> PyResult<Option<PyObject>> {
+        let bytes = py.allow_threads(|| {
+            with_db(&self.inner, |db| {
+                Ok(db.get_field(&key.0, &path).ok().flatten())
+            })
+        })?;
+        match bytes {
+            Some(bytes) => {
+                let raw = PyBytes::new_bound(py, &bytes);
+                Ok(Some(
+                    json_module(py)?.call_method1("loads", (raw,))?.unbind(),
+                ))
+            }
+            None => Ok(None),
+        }
+    }
+
+    /// Write an opaque value without JSON encoding it
+    fn put_bytes(&self, py: Python<'_>, key: DocPath, blob: &[u8]) -> PyResult<()> {
+        let key = key.0;
+        let blob = blob.to_vec();
+        py.allow_threads(|| {
+            with_db(&self.inner, |db| {
+                db.put_bytes(key.clone(), blob)
+                    .map_err(|e| format!("Failed to put bytes: {}: {}", key, e))
+            })
+        })
+    }
+
+    /// Read a value without JSON decoding it, returning None if it does not exist
+    fn get_bytes(&self, py: Python<'_>, key: DocPath) -> PyResult<Option<PyObject>> {
+        let bytes =
+            py.allow_threads(|| with_db(&self.inner, |db| Ok(db.get(&key.0).ok().flatten())))?;
+        Ok(bytes.map(|bytes| PyBytes::new_bound(py, &bytes).into_any().unbind()))
+    }
+
+    /// Read several documents under one lock, returning None for missing ones
+    fn multi_get(&self, py: Python<'_>, keys: Vec<DocPath>) -> PyResult<Vec<Option<PyObject>>> {
+        let values = py.allow_threads(|| {
+            with_db(&self.inner, |db| {
+                Ok(keys
+                    .iter()
+                    .map(|key| db.get(&key.0).ok().flatten())
+                    .collect::<Vec<_>>())
+            })
+        })?;
+        let json = json_module(py)?;
+        values
+            .into_iter()
+            .map(|bytes| match bytes {
+                Some(bytes) => {
+                    let raw = PyBytes::new_bound(py, &bytes);
+                    Ok(Some(json.call_method1("loads", (raw,))?.unbind()))
+                }
+                None => Ok(None),
+            })
+            .collect()
+    }
+
+    /// Write several documents with a single WAL append
+    fn multi_put(&self, py: Python<'_>, items: &Bound<'_, PyAny>) -> PyResult<()> {
+        let items = items
+            .iter()?
+            .map(|item| {
+                let (key, value): (DocPath, Bound<'_, PyAny>) = item?.extract()?;
+                Ok((key.0, to_document_bytes(&value)?))
+            })
+            .collect::<PyResult<Vec<_>>>()?;
+        py.allow_threads(|| {
+            with_db(&self.inner, |db| {
+                db.multi_put(items)
+                    .map_err(|e| format!("Failed to put documents: {}", e))
+            })
+        })
+    }
+
+    /// Delete a document
+    fn delete(&self, py: Python<'_>, key: DocPath) -> PyResult<()> {
+        let key = key.0;
+        py.allow_threads(|| {
+            with_db(&self.inner, |db| {
+                db.delete(key.clone())
+                    .map_err(|e| format!("Failed to delete document: {}: {}", key, e))
+            })
+        })
+    }
+
+    /// Create a new write batch
+    fn batch(&self) -> PyResult<WriteBatch> {
+        let batch = with_db(&self.inner, |db| Ok(db.batch()))?;
+        Ok(WriteBatch {
+            db: self.inner.clone(),
+            inner: batch,
+        })
+    }
+
+    /// Run compaction to merge SST files and remove tombstones
+    fn compact(&self, py: Python<'_>) -> PyResult<CompactionStats> {
+        let stats = py.allow_threads(|| {
+            with_db(&self.inner, |db| {
+                db.compact()
+                    .map_err(|e| format!("Compaction failed: {}", e))
+            })
+        })?;
+        Ok(CompactionStats {
+            files_before: stats.files_before as u64,
+            files_after: stats.files_after as u64,
+            entries_before: stats.entries_before as u64,
+            entries_after: stats.entries_after as u64,
+            tombstones_removed: stats.tombstones_removed as u64,
+            size_before: stats.size_before,
+            size_after: stats.size_after,
+        })
+    }
+
+    /// Flush memtable to SST file
+    fn flush(&self, py: Python<'_>) -> PyResult<()> {
+        py.allow_threads(|| {
+            with_db(&self.inner, |db| {
+                db.flush().map_err(|e| format!("Flush failed: {}", e))
+            })
+        })
+    }
+
+    /// Close the database and free resources
+    fn close(&self) -> PyResult<()> {
+        let mut guard = self
+            .inner
+            .lock()
+            .map_err(|_| PyRuntimeError::new_err("Lock error"))?;
+        guard.take();
+        Ok(())
+    }
+
+    fn __enter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __exit__(
+        &self,
+        _exc_type: &Bound<'_, PyAny>,
+        _exc_val: &Bound<'_, PyAny>,
+        _exc_tb: &Bound<'_, PyAny>,
+    ) -> PyResult<()> {
+        self.close()
+    }
+}
+
+/// Atomic write batch
+#[pyclass(module = "firelocal._firelocal_native")]
+pub struct WriteBatch {
+    db: SharedDb,
+    inner: CoreWriteBatch,
+}
+
+#[pymethods]
+impl WriteBatch {
+    /// Add a set operation to the batch
+    fn set<'py>(
+        mut slf: PyRefMut<'py, Self>,
+        path: DocPath,
+        data: &Bound<'py, PyAny>,
+    ) -> PyResult<PyRefMut<'py, Self>> {
+        let bytes = to_document_bytes(data)?;
+        slf.inner.set(path.0, bytes);
+        Ok(slf)
+    }
+
+    /// Add an update operation to the batch
+    fn update<'py>(
+        mut slf: PyRefMut<'py, Self>,
+        path: DocPath,
+        data: &Bound<'py, PyAny>,
+    ) -> PyResult<PyRefMut<'py, Self>> {
+        let bytes = to_document_bytes(data)?;
+        slf.inner.update(path.0, bytes);
+        Ok(slf)
+    }
+
+    /// Add a delete operation to the batch
+    fn delete(mut slf: PyRefMut<'_, Self>, path: DocPath) -> PyRefMut<'_, Self> {
+        slf.inner.delete(path.0);
+        slf
+    }
+
+    /// Commit the batch atomically
+    fn commit(&self, py: Python<'_>) -> PyResult<()> {
+        py.allow_threads(|| {
+            with_db(&self.db, |db| {
+                db.commit_batch(&self.inner)
+                    .map_err(|e| format!("Failed to commit batch: {}", e))
+            })
+        })
+    }
+
+    fn __len__(&self) -> usize {
+        self.inner.len()
+    }
+}
+
+/// Statistics from a compaction run
+#[pyclass(module = "firelocal._firelocal_native", frozen)]
+pub struct CompactionStats {
+    #[pyo3(get)]
+    files_before: u64,
+    #[pyo3(get)]
+    files_after: u64,
+    #[pyo3(get)]
+    entries_before: u64,
+    #[pyo3(get)]
+    entries_after: u64,
+    #[pyo3(get)]
+    tombstones_removed: u64,
+    #[pyo3(get)]
+    size_before: u64,
+    #[pyo3(get)]
+    size_after: u64,
+}
+
+#[pymethods]
+impl CompactionStats {
+    /// Bytes saved
+    #[getter]
+    fn size_reduction(&self) -> u64 {
+        self.size_before.saturating_sub(self.size_after)
+    }
+
+    /// Percentage of space saved
+    #[getter]
+    fn size_reduction_percent(&self) -> f64 {
+        if self.size_before == 0 {
+            return 0.0;
+        }
+        (self.size_reduction() as f64 / self.size_before as f64) * 100.0
+    }
+
+    fn __repr__(&self) -> String {
+        format!(
+            "CompactionStats(files: {}→{}, tombstones: {}, reduction: {:.1}%)",
+            self.files_before,
+            self.files_after,
+            self.tombstones_removed,
+            self.size_reduction_percent()
+        )
+    }
+}
+
+#[pymodule]
+fn _firelocal_native(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_class::<FireLocal>()?;
+    m.add_class::<WriteBatch>()?;
+    m.add_class::<CompactionStats>()?;
+    Ok(())
+}
@@ -1,5 +1,21 @@
 from setuptools import setup, find_packages
 
+try:
+    from setuptools_rust import Binding, RustExtension
+
+    rust_extensions = [
+        # Optional: falls back to the ctypes bindings when Rust is unavailable
+        RustExtension(
+            "firelocal._firelocal_native",
+            path="native/Cargo.toml",
+            binding=Binding.PyO3,
+            py_limited_api=True,
+            optional=True,
+        ),
+    ]
+except ImportError:
+    rust_extensions = []
+
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
@@ -12,6 +28,11 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/rajdipk/Firelocal",
     packages=find_packages(),
+    # Prebuilt core library copied into the package before building a wheel
+    package_data={"firelocal": ["*firelocal_core.so", "*firelocal_core.dylib", "*firelocal_core.dll"]},
+    include_package_data=True,
+    rust_extensions=rust_extensions,
+    zip_safe=False,
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -24,7 +45,10 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=[
-        # No external dependencies for core functionality
+        # Faster JSON encoding; core.py falls back to stdlib json without it
+        "orjson>=3.6; platform_python_implementation == 'CPython'",
+        # CFFI bindings for PyPy, which cannot load the native extension
+        "cffi>=1.12; platform_python_implementation == 'PyPy'",
     ],
     extras_require={
         "dev": [
@@ -13,6 +13,53 @@ from firelocal import (
 )
 
 
+@pytest.fixture
+def db(tmp_path):
+    """Database in a temporary directory, skipped without a built core library"""
+    try:
+        db = FireLocal(str(tmp_path / "db"))
+    except RuntimeError as e:
+        pytest.skip(str(e))
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def cffi_db(tmp_path):
+    """CFFI-backed database, skipped without cffi or a built core library"""
+    pytest.importorskip("cffi")
+    from firelocal import _cffi_impl
+    
+    try:
+        db = _cffi_impl.FireLocal(str(tmp_path / "db"))
+    except RuntimeError as e:
+        pytest.skip(str(e))
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def lib_layout(tmp_path, monkeypatch):
+    """Point library lookup at a fake checkout under tmp_path"""
+    from firelocal import core
+    
+    workspace = tmp_path / "ws"
+    package_dir = workspace / "bindings" / "python" / "firelocal"
+    package_dir.mkdir(parents=True)
+    monkeypatch.setattr(core, "__file__", str(package_dir / "core.py"))
+    monkeypatch.setattr(core, "_library_name", lambda: "libfirelocal_test.so")
+    monkeypatch.delenv("FIRELOCAL_LIB", raising=False)
+    core._get_library_path.cache_clear()
+    yield workspace, package_dir
+    core._get_library_path.cache_clear()
+
+
+def _touch(path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.touch()
+    return str(path)
+
+
 def test_firelocal_creation():
     """Test creating a FireLocal instance"""
     db = FireLocal("./test_data")
@@ -40,9 +87,7 @@ def test_batch_operations():
     batch.set("users/bob", {"name": "Bob"})
     batch.delete("users/charlie")
     
-    assert len(batch.operations) == 3
-    assert batch.operations[0]["type"] == "set"
-    assert batch.operations[2]["type"] == "delete"
+    assert len(batch) == 3
 
 
 def test_field_values():
@@ -64,6 +109,39 @@ def test_field_values():
     assert delete["_firelocal_field_value"] == "delete"
 
 
+def test_field_value_serialization():
+    """Test FieldValue sentinels encode like their dict form"""
+    from firelocal._json import dumps, loads
+    
+    doc = {
+        "count": increment(2),
+        "tags": array_union(["a", "b"]),
+        "old": delete_field(),
+    }
+    assert loads(dumps(doc)) == {
+        "count": {"_firelocal_field_value": "increment", "value": 2},
+        "tags": {"_firelocal_field_value": "arrayUnion", "value": ["a", "b"]},
+        "old": {"_firelocal_field_value": "delete"},
+    }
+
+
+def test_document_encoding_matches_stdlib():
+    """Test documents stdlib json accepts also encode with orjson installed"""
+    import json
+    import math
+    from firelocal._json import dumps, loads
+    
+    assert loads(dumps({1: "a"})) == {"1": "a"}
+    
+    doc = {1: "a", "big": 2**70, "ts": server_timestamp()}
+    assert loads(dumps(doc)) == json.loads(json.dumps(doc))
+    
+    special = {"nan": float("nan"), "inf": [float("inf"), float("-inf")]}
+    assert dumps(special) == json.dumps(special).encode("utf-8")
+    decoded = loads(dumps(special))
+    assert math.isnan(decoded["nan"]) and decoded["inf"] == [float("inf"), float("-inf")]
+
+
 def test_compaction_stats():
     """Test compaction statistics"""
     db = FireLocal("./test_data")
@@ -73,5 +151,140 @@ def test_compaction_stats():
     assert hasattr(stats, "size_reduction_percent")
 
 
+def test_multi_get(db):
+    """Test reading several documents in one call"""
+    db.put("users/alice", {"name": "Alice"})
+    db.put("users/bob", {"name": "Bob"})
+    
+    assert db.multi_get(["users/alice", "users/missing", b"users/bob"]) == [
+        {"name": "Alice"},
+        None,
+        {"name": "Bob"},
+    ]
+    assert db.multi_get([]) == []
+
+
+def test_multi_put(db):
+    """Test writing several documents in one call, from any iterable"""
+    db.multi_put([("users/alice", {"name": "Alice"}), ("users/bob", b'{"name":"Bob"}')])
+    db.multi_put((f"items/{i}", {"n": i}) for i in range(3))
+    
+    assert db.get("users/alice") == {"name": "Alice"}
+    assert db.get("users/bob") == {"name": "Bob"}
+    assert db.multi_get([f"items/{i}" for i in range(3)]) == [{"n": 0}, {"n": 1}, {"n": 2}]
+
+
+def test_put_bytes_and_get_bytes(db):
+    """Test opaque values round-trip without JSON encoding"""
+    import json
+    
+    db.put_bytes("blobs/raw", b"\x00\xffnot json")
+    assert db.get_bytes("blobs/raw") == b"\x00\xffnot json"
+    assert db.get_bytes("blobs/missing") is None
+    
+    db.put("users/alice", {"name": "Alice"})
+    assert json.loads(db.get_bytes("users/alice")) == {"name": "Alice"}
+
+
+def test_get_field(db):
+    """Test reading one nested field of a document"""
+    db.put("users/alice", {"profile": {"name": "Alice", "a/b": 1}, "tags": ["x", "y"]})
+    
+    assert db.get_field("users/alice", ["profile", "name"]) == "Alice"
+    assert db.get_field("users/alice", ["profile", "a/b"]) == 1
+    assert db.get_field("users/alice", ["tags", "1"]) == "y"
+    assert db.get_field("users/alice", ["profile"]) == {"name": "Alice", "a/b": 1}
+    assert db.get_field("users/alice", ["profile", "missing"]) is None
+    assert db.get_field("users/missing", ["profile"]) is None
+    
+    db.put("users/bob", {"nickname": None})
+    assert db.get_field("users/bob", ["nickname"]) is None
+    
+    with pytest.raises(TypeError):
+        db.get_field("users/alice", "profile")
+
+
+def test_get_non_finite_numbers(db):
+    """Test documents holding NaN or infinities round-trip"""
+    import math
+    
+    db.put("stats/a", {"ratio": float("nan"), "max": float("inf")})
+    doc = db.get("stats/a")
+    assert math.isnan(doc["ratio"]) and doc["max"] == float("inf")
+
+
+def test_cffi_only_selected_on_pypy():
+    """Test CPython keeps the native or ctypes bindings even when cffi is importable"""
+    import platform
+    import firelocal
+    
+    if platform.python_implementation() == "PyPy":
+        pytest.skip("CFFI is the expected fallback on PyPy")
+    assert firelocal.FireLocal.__module__ != "firelocal._cffi_impl"
+
+
+def test_cffi_operations(cffi_db):
+    """Test the CFFI bindings against the core library"""
+    cffi_db.put("users/alice", {"name": "Alice", "tags": ["a", "b"]})
+    assert cffi_db.get("users/alice") == {"name": "Alice", "tags": ["a", "b"]}
+    assert cffi_db.get_field("users/alice", ["tags", "1"]) == "b"
+    
+    cffi_db.multi_put([("users/bob", {"name": "Bob"}), ("users/carol", b'{"name":"Carol"}')])
+    assert cffi_db.multi_get(["users/bob", "users/missing", "users/carol"]) == [
+        {"name": "Bob"},
+        None,
+        {"name": "Carol"},
+    ]
+    
+    cffi_db.put_bytes("blobs/1", b"\x00\x01")
+    assert cffi_db.get_bytes("blobs/1") == b"\x00\x01"
+    
+    batch = cffi_db.batch()
+    batch.set("users/dave", {"name": "Dave"})
+    batch.delete("users/bob")
+    batch.commit()
+    assert cffi_db.get("users/dave") == {"name": "Dave"}
+    assert cffi_db.get("users/bob") is None
+
+
+def test_cffi_reports_missing_symbols(monkeypatch):
+    """Test a library without the FireLocal symbols fails at construction"""
+    import ctypes.util
+    
+    pytest.importorskip("cffi")
+    from firelocal import _cffi_impl
+    
+    libc = ctypes.util.find_library("c")
+    if libc is None:
+        pytest.skip("no C library to stand in for an old core library")
+    monkeypatch.setattr(_cffi_impl, "_lib", None)
+    monkeypatch.setattr(_cffi_impl, "_get_library_path", lambda: libc)
+    
+    with pytest.raises(RuntimeError, match="library not loaded"):
+        _cffi_impl.FireLocal("unused")
+
+
+def test_library_path_order(lib_layout, monkeypatch):
+    """Test lookup order: FIRELOCAL_LIB, bundled, then search paths"""
+    from firelocal.core import _get_library_path
+    
+    workspace, package_dir = lib_layout
+    debug = _touch(workspace / "target" / "debug" / "libfirelocal_test.so")
+    assert _get_library_path() == debug
+    
+    # A release build wins over debug once it exists
+    release = _touch(workspace / "target" / "release" / "libfirelocal_test.so")
+    _get_library_path.cache_clear()
+    assert _get_library_path() == release
+    
+    bundled = _touch(package_dir / "libfirelocal_test.so")
+    _get_library_path.cache_clear()
+    assert _get_library_path() == bundled
+    
+    monkeypatch.setenv("FIRELOCAL_LIB", "/opt/custom/libfirelocal_test.so")
+    _get_library_path.cache_clear()
+    assert _get_library_path() == "/opt/custom/libfirelocal_test.so"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -103,6 +103,224 @@ pub unsafe extern "C" fn firelocal_get_resource(
     std::ptr::null_mut()
 }
 
+/// Like `firelocal_get_resource`, but also writes the document length to `out_len`
+/// so callers can copy the result without scanning for the terminator.
+///
+/// The returned pointer is NUL terminated and must be freed with `firelocal_free_string`.
+#[unsafe(no_mangle)]
+pub unsafe extern "C" fn firelocal_get_resource_len(
+    db: *mut FireLocal,
+    key: *const c_char,
+    out_len: *mut usize,
+) -> *mut c_char {
+    let db = unsafe {
+        if db.is_null() || out_len.is_null() {
+            return std::ptr::null_mut();
+        }
+        &*db
+    };
+
+    let key_str = unsafe { CStr::from_ptr(key) }.to_string_lossy();
+
+    if let Ok(Some(val)) = db.get(&key_str) {
+        let len = val.len();
+        if let Ok(c_str) = CString::new(val) {
+            unsafe {
+                *out_len = len;
+            }
+            return c_str.into_raw();
+        }
+    }
+    std::ptr::null_mut()
+}
+
+/// Store `len` bytes from `data` under `key` verbatim.
+///
+/// Unlike `firelocal_put_resource` the value may contain NUL bytes and does not
+/// have to be a JSON document.
+#[unsafe(no_mangle)]
+pub unsafe extern "C" fn firelocal_put_bytes(
+    db: *mut FireLocal,
+    key: *const c_char,
+    data: *const u8,
+    len: usize,
+) -> i32 {
+    let db = unsafe {
+        if db.is_null() || key.is_null() || data.is_null() {
+            return -1;
+        }
+        &mut *db
+    };
+
+    let key_str = unsafe { CStr::from_ptr(key) }
+        .to_string_lossy()
+        .into_owned();
+    let value = unsafe { std::slice::from_raw_parts(data, len) }.to_vec();
+
+    if db.put_bytes(key_str, value).is_ok() {
+        return 0;
+    }
+    -1
+}
+
+/// Read the raw value stored under `key`.
+///
+/// Returns null if the key does not exist. The value's size is written to
+/// `out_len` and it must be freed with `firelocal_free_buffer`.
+#[unsafe(no_mangle)]
+pub unsafe extern "C" fn firelocal_get_bytes(
+    db: *mut FireLocal,
+    key: *const c_char,
+    out_len: *mut usize,
+) -> *mut u8 {
+    let db = unsafe {
+        if db.is_null() || key.is_null() || out_len.is_null() {
+            return std::ptr::null_mut();
+        }
+        &*db
+    };
+
+    let key_str = unsafe { CStr::from_ptr(key) }.to_string_lossy();
+
+    if let Ok(Some(val)) = db.get(&key_str) {
+        let out = val.into_boxed_slice();
+        unsafe {
+            *out_len = out.len();
+        }
+        return Box::into_raw(out) as *mut u8;
+    }
+    std::ptr::null_mut()
+}
+
+/// Read one field of the JSON document stored under `key`.
+///
+/// `path` holds `path_len` bytes of `[segment_len:u32le][segment]` entries naming
+/// the nested field. Returns the field as JSON, or null if the document or field
+/// does not exist. The result's size is written to `out_len` and it must be
+/// freed with `firelocal_free_buffer`.
+#[unsafe(no_mangle)]
+pub unsafe extern "C" fn firelocal_get_field(
+    db: *mut FireLocal,
+    key: *const c_char,
+    path: *const u8,
+    path_len: usize,
+    out_len: *mut usize,
+) -> *mut u8 {
+    let db = unsafe {
+        if db.is_null() || key.is_null() || out_len.is_null() || (path.is_null() && path_len != 0) {
+            return std::ptr::null_mut();
+        }
+        &*db
+    };
+
+    let key_str = unsafe { CStr::from_ptr(key) }.to_string_lossy();
+    let path = if path_len == 0 {
+        &[][..]
+    } else {
+        unsafe { std::slice::from_raw_parts(path, path_len) }
+    };
+
+    let mut segments = Vec::new();
+    let mut offset = 0;
+    while offset < path.len() {
+        if path.len() - offset < 4 {
+            return std::ptr::null_mut();
+        }
+        let mut len_bytes = [0u8; 4];
+        len_bytes.copy_from_slice(&path[offset..offset + 4]);
+        let segment_len = u32::from_le_bytes(len_bytes) as usize;
+        offset += 4;
+
+        if path.len() - offset < segment_len {
+            return std::ptr::null_mut();
+        }
+        segments.push(String::from_utf8_lossy(&path[offset..offset + segment_len]));
+        offset += segment_len;
+    }
+
+    if let Ok(Some(val)) = db.get_field(&key_str, &segments) {
+        let out = val.into_boxed_slice();
+        unsafe {
+            *out_len = out.len();
+        }
+        return Box::into_raw(out) as *mut u8;
+    }
+    std::ptr::null_mut()
+}
+
+/// Length written in place of a document length by `firelocal_multi_get` for missing keys
+pub const MULTI_GET_MISSING: u32 = u32::MAX;
+
+/// Look up several documents in a single call.
+///
+/// `keys` holds `len` bytes of `[key_len:u32le][key]` entries. The result holds a
+/// `[doc_len:u32le][doc]` entry per key in the same order, with `MULTI_GET_MISSING`
+/// as the length of documents that were not found. Its size is written to `out_len`
+/// and it must be freed with `firelocal_free_buffer`.
+#[unsafe(no_mangle)]
+pub unsafe extern "C" fn firelocal_multi_get(
+    db: *mut FireLocal,
+    keys: *const u8,
+    len: usize,
+    out_len: *mut usize,
+) -> *mut u8 {
+    let db = unsafe {
+        if db.is_null() || out_len.is_null() || (keys.is_null() && len != 0) {
+            return std::ptr::null_mut();
+        }
+        &*db
+    };
+
+    let keys = if len == 0 {
+        &[][..]
+    } else {
+        unsafe { std::slice::from_raw_parts(keys, len) }
+    };
+
+    let mut out = Vec::new();
+    let mut offset = 0;
+    while offset < keys.len() {
+        if keys.len() - offset < 4 {
+            return std::ptr::null_mut();
+        }
+        let mut len_bytes = [0u8; 4];
+        len_bytes.copy_from_slice(&keys[offset..offset + 4]);
+        let key_len = u32::from_le_bytes(len_bytes) as usize;
+        offset += 4;
+
+        if keys.len() - offset < key_len {
+            return std::ptr::null_mut();
+        }
+        let key = String::from_utf8_lossy(&keys[offset..offset + key_len]);
+        offset += key_len;
+
+        match db.get(&key) {
+            Ok(Some(val)) => {
+                out.extend_from_slice(&(val.len() as u32).to_le_bytes());
+                out.extend_from_slice(&val);
+            }
+            _ => out.extend_from_slice(&MULTI_GET_MISSING.to_le_bytes()),
+        }
+    }
+
+    let out = out.into_boxed_slice();
+    unsafe {
+        *out_len = out.len();
+    }
+    Box::into_raw(out) as *mut u8
+}
+
+/// Free a buffer returned by `firelocal_multi_get`, `firelocal_get_bytes` or
+/// `firelocal_get_field`.
+#[unsafe(no_mangle)]
+pub unsafe extern "C" fn firelocal_free_buffer(buf: *mut u8, len: usize) {
+    if !buf.is_null() {
+        unsafe {
+            drop(Box::from_raw(std::ptr::slice_from_raw_parts_mut(buf, len)));
+        }
+    }
+}
+
 #[unsafe(no_mangle)]
 pub unsafe extern "C" fn firelocal_free_string(s: *mut c_char) {
     if !s.is_null() {
@@ -235,6 +453,93 @@ pub unsafe extern "C" fn firelocal_batch_commit(
     -1
 }
 
+/// Commit a batch encoded as contiguous frames in a single call.
+///
+/// `buf` holds `len` bytes of `[op:u8][path_len:u32le][data_len:u32le][path][data]`
+/// frames (see `WriteBatch::from_frames`), so bindings can submit a whole batch
+/// without one FFI call per operation.
+#[unsafe(no_mangle)]
+pub unsafe extern "C" fn firelocal_batch_commit_ops(
+    db: *mut FireLocal,
+    buf: *const u8,
+    len: usize,
+) -> i32 {
+    let db = unsafe {
+        if db.is_null() {
+            return -1;
+        }
+        &mut *db
+    };
+
+    let frames = if len == 0 {
+        &[][..]
+    } else {
+        if buf.is_null() {
+            return -1;
+        }
+        unsafe { std::slice::from_raw_parts(buf, len) }
+    };
+
+    let batch = match crate::transaction::WriteBatch::from_frames(frames) {
+        Ok(batch) => batch,
+        Err(_) => return -1,
+    };
+
+    if db.commit_batch(&batch).is_ok() {
+        return 0;
+    }
+    -1
+}
+
+/// Write `count` documents in one call.
+///
+/// `buf` uses the same frames as `firelocal_batch_commit_ops`, but every frame
+/// must be a set. The documents go to the WAL in a single append and sync.
+#[unsafe(no_mangle)]
+pub unsafe extern "C" fn firelocal_multi_put(
+    db: *mut FireLocal,
+    buf: *const u8,
+    buf_len: usize,
+    count: u32,
+) -> i32 {
+    let db = unsafe {
+        if db.is_null() {
+            return -1;
+        }
+        &mut *db
+    };
+
+    let frames = if buf_len == 0 {
+        &[][..]
+    } else {
+        if buf.is_null() {
+            return -1;
+        }
+        unsafe { std::slice::from_raw_parts(buf, buf_len) }
+    };
+
+    let batch = match crate::transaction::WriteBatch::from_frames(frames) {
+        Ok(batch) => batch,
+        Err(_) => return -1,
+    };
+    if batch.len() != count as usize {
+        return -1;
+    }
+
+    let mut items = Vec::with_capacity(batch.len());
+    for op in batch.into_operations() {
+        match op {
+            crate::transaction::BatchOperation::Set { path, data } => items.push((path, data)),
+            _ => return -1,
+        }
+    }
+
+    if db.multi_put(items).is_ok() {
+        return 0;
+    }
+    -1
+}
+
 #[unsafe(no_mangle)]
 pub unsafe extern "C" fn firelocal_batch_free(batch: *mut crate::transaction::WriteBatch) {
     if !batch.is_null() {
@@ -272,6 +577,50 @@ pub unsafe extern "C" fn firelocal_compact(db: *mut FireLocal) -> *mut c_char {
     std::ptr::null_mut()
 }
 
+/// Compaction statistics laid out for direct reads over FFI
+#[repr(C)]
+#[derive(Debug, Default, Clone, Copy)]
+pub struct CompactionStatsC {
+    pub files_before: u64,
+    pub files_after: u64,
+    pub entries_before: u64,
+    pub entries_after: u64,
+    pub tombstones_removed: u64,
+    pub size_before: u64,
+    pub size_after: u64,
+}
+
+/// Run compaction and write the statistics into `out`, avoiding the JSON
+/// round trip of `firelocal_compact`. Returns 0 on success, -1 on failure.
+#[unsafe(no_mangle)]
+pub unsafe extern "C" fn firelocal_compact_struct(
+    db: *mut FireLocal,
+    out: *mut CompactionStatsC,
+) -> i32 {
+    let db = unsafe {
+        if db.is_null() || out.is_null() {
+            return -1;
+        }
+        &*db
+    };
+
+    if let Ok(stats) = db.compact() {
+        unsafe {
+            *out = CompactionStatsC {
+                files_before: stats.files_before as u64,
+                files_after: stats.files_after as u64,
+                entries_before: stats.entries_before as u64,
+                entries_after: stats.entries_after as u64,
+                tombstones_removed: stats.tombstones_removed as u64,
+                size_before: stats.size_before,
+                size_after: stats.size_after,
+            };
+        }
+        return 0;
+    }
+    -1
+}
+
 #[unsafe(no_mangle)]
 pub unsafe extern "C" fn firelocal_flush(db: *mut FireLocal) -> i32 {
     let db = unsafe {
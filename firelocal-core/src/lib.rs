@@ -38,6 +38,9 @@ use std::io;
 use std::path::PathBuf;
 use std::sync::Arc;
 
+/// WAL op tag for values written by `put_bytes`, replayed without indexing
+const WAL_OP_PUT_OPAQUE: u8 = 2;
+
 pub struct FireLocal<S: Storage = StdStorage> {
     path: PathBuf,
     storage: Arc<S>,
@@ -114,7 +117,7 @@ impl<S: Storage> FireLocal<S> {
                 }
                 let key = String::from_utf8_lossy(&entry[5..5 + k_len]).to_string();
 
-                if op == 0 {
+                if op == 0 || op == WAL_OP_PUT_OPAQUE {
                     // Put
                     if entry.len() < 5 + k_len + 4 {
                         continue;
@@ -142,6 +145,12 @@ impl<S: Storage> FireLocal<S> {
 
                     memtable.put(key.clone(), value);
 
+                    // Opaque values from put_bytes are never indexed, and replace
+                    // any document previously indexed under the key
+                    if op == WAL_OP_PUT_OPAQUE {
+                        let _ = index.on_delete(&key);
+                        continue;
+                    }
                     if let Ok(json_str) =
                         std::str::from_utf8(&entry[v_len_offset + 4..v_len_offset + 4 + v_len])
                     {
@@ -233,6 +242,85 @@ impl<S: Storage> FireLocal<S> {
     }
 
     pub fn put(&mut self, key: String, value: Vec<u8>) -> io::Result<()> {
+        let json_str = self.validate_put(&key, &value)?;
+
+        // Reuse the validated str instead of re-checking UTF-8 for the index
+        if let Ok(doc) = Document::from_json(json_str) {
+            let _ = self.index.on_put(&doc.path, &doc);
+        }
+
+        let entry = Self::put_entry(0, &key, &value);
+        self.wal.append(&entry)?;
+        self.memtable.put(key, value);
+        self.notify_listeners();
+        Ok(())
+    }
+
+    /// Write several documents with a single WAL append and sync.
+    ///
+    /// Every item is validated before anything is written, so a rejected
+    /// item leaves the database untouched.
+    pub fn multi_put(&mut self, items: Vec<(String, Vec<u8>)>) -> io::Result<()> {
+        if items.is_empty() {
+            return Ok(());
+        }
+
+        let mut docs = Vec::with_capacity(items.len());
+        for (key, value) in &items {
+            let json_str = self.validate_put(key, value)?;
+            docs.push(Document::from_json(json_str).ok());
+        }
+
+        for doc in docs.iter().flatten() {
+            let _ = self.index.on_put(&doc.path, doc);
+        }
+
+        let entries: Vec<Vec<u8>> = items
+            .iter()
+            .map(|(key, value)| Self::put_entry(0, key, value))
+            .collect();
+        self.wal.append_all(entries.iter().map(Vec::as_slice))?;
+
+        for (key, value) in items {
+            self.memtable.put(key, value);
+        }
+        self.notify_listeners();
+        Ok(())
+    }
+
+    /// Write an opaque value verbatim.
+    ///
+    /// The value is not required to be UTF-8 or JSON and is not indexed, so
+    /// callers with pre-serialized payloads skip encoding them as documents.
+    /// The WAL record is tagged so replay does not index it either.
+    pub fn put_bytes(&mut self, key: String, value: Vec<u8>) -> io::Result<()> {
+        self.validate_write(&key, &value)?;
+        // Drop index entries of a document this value overwrites
+        let _ = self.index.on_delete(&key);
+
+        let entry = Self::put_entry(WAL_OP_PUT_OPAQUE, &key, &value);
+        self.wal.append(&entry)?;
+        self.memtable.put(key, value);
+        self.notify_listeners();
+        Ok(())
+    }
+
+    /// Check a document write and return its data as UTF-8
+    fn validate_put<'a>(&self, key: &str, value: &'a [u8]) -> io::Result<&'a str> {
+        self.validate_write(key, value)?;
+
+        // Skip strict JSON validation for better performance and flexibility
+        // Just check if it's valid UTF-8
+        std::str::from_utf8(value).map_err(|_| {
+            io::Error::new(
+                io::ErrorKind::InvalidData,
+                "Document data must be valid UTF-8",
+            )
+        })
+    }
+
+    /// Check the path, value and write rules shared by every put
+    fn validate_write(&self, key: &str, value: &[u8]) -> io::Result<()> {
         // Only validate the most basic requirements
         if key.is_empty() {
             return Err(io::Error::new(
@@ -240,7 +328,7 @@ impl<S: Storage> FireLocal<S> {
                 "Document path cannot be empty",
             ));
         }
-        validation::validate_path(&key)
+        validation::validate_path(key)
             .map_err(|e| io::Error::new(io::ErrorKind::InvalidInput, e.to_string()))?;
 
         if value.is_empty() {
@@ -250,18 +338,9 @@ impl<S: Storage> FireLocal<S> {
             ));
         }
 
-        // Skip strict JSON validation for better performance and flexibility
-        // Just check if it's valid UTF-8
-        if std::str::from_utf8(&value).is_err() {
-            return Err(io::Error::new(
-                io::ErrorKind::InvalidData,
-                "Document data must be valid UTF-8",
-            ));
-        }
-
         // Skip rules check if no rules are loaded
         if !self.rules.is_empty() {
-            if let Err(e) = self.check_rules(&key, "write") {
+            if let Err(e) = self.check_rules(key, "write") {
                 return Err(io::Error::new(
                     io::ErrorKind::PermissionDenied,
                     e.to_string(),
@@ -269,28 +348,18 @@ impl<S: Storage> FireLocal<S> {
             }
         }
 
-        if let Ok(json_str) = std::str::from_utf8(&value) {
-            if let Ok(doc) = Document::from_json(json_str) {
-                let _ = self.index.on_put(&doc.path, &doc);
-            }
-        }
+        Ok(())
+    }
 
-        // Optimize WAL entry creation with pre-allocated buffer
-        let key_len = key.len();
-        let value_len = value.len();
-        let total_len = 1 + 4 + key_len + 4 + value_len;
-        
-        let mut entry = Vec::with_capacity(total_len);
-        entry.push(0u8);
-        entry.extend_from_slice(&(key_len as u32).to_le_bytes());
+    /// Encode a put as a `[op][key_len][key][value_len][value]` WAL record
+    fn put_entry(op: u8, key: &str, value: &[u8]) -> Vec<u8> {
+        let mut entry = Vec::with_capacity(1 + 4 + key.len() + 4 + value.len());
+        entry.push(op);
+        entry.extend_from_slice(&(key.len() as u32).to_le_bytes());
         entry.extend_from_slice(key.as_bytes());
-        entry.extend_from_slice(&(value_len as u32).to_le_bytes());
-        entry.extend_from_slice(&value);
-
-        self.wal.append(&entry)?;
-        self.memtable.put(key, value);
-        self.notify_listeners();
-        Ok(())
+        entry.extend_from_slice(&(value.len() as u32).to_le_bytes());
+        entry.extend_from_slice(value);
+        entry
     }
 
     pub fn delete(&mut self, key: String) -> io::Result<()> {
@@ -362,6 +431,34 @@ impl<S: Storage> FireLocal<S> {
         Ok(None)
     }
 
+    /// Read one field of a JSON document, following `path` through nested
+    /// objects (and arrays, for numeric segments).
+    ///
+    /// Returns the field re-encoded as JSON, or None if the document or the
+    /// field does not exist, so callers only decode the value they need.
+    pub fn get_field<P: AsRef<str>>(&self, key: &str, path: &[P]) -> io::Result<Option<Vec<u8>>> {
+        let bytes = match self.get(key)? {
+            Some(bytes) => bytes,
+            None => return Ok(None),
+        };
+        let doc: serde_json::Value = serde_json::from_slice(&bytes)
+            .map_err(|e| io::Error::new(io::ErrorKind::InvalidData, e))?;
+
+        // Build a JSON pointer, escaping '~' and '/' per RFC 6901
+        let mut pointer = String::new();
+        for segment in path {
+            pointer.push('/');
+            pointer.push_str(&segment.as_ref().replace('~', "~0").replace('/', "~1"));
+        }
+
+        match doc.pointer(&pointer) {
+            Some(value) => serde_json::to_vec(value)
+                .map(Some)
+                .map_err(|e| io::Error::new(io::ErrorKind::InvalidData, e)),
+            None => Ok(None),
+        }
+    }
+
     pub fn query(&self, q: &QueryAst) -> io::Result<Vec<Document>> {
         // Assume list permissions handled by collection rule (not impl in M4) or per-doc.
         let paths = self
@@ -70,14 +70,30 @@ impl<S: Storage> WriteAheadLog<S> {
     }
 
     pub fn append(&mut self, data: &[u8]) -> io::Result<()> {
-        let len = data.len() as u32;
-        let mut hasher = Hasher::new();
-        hasher.update(data);
-        let crc = hasher.finalize();
+        self.append_all(std::iter::once(data))
+    }
+
+    /// Append several records with a single write and a single sync.
+    ///
+    /// Records use the same `[len][crc][data]` layout as `append`, so the
+    /// iterator cannot tell the difference.
+    pub fn append_all<'a, I>(&mut self, records: I) -> io::Result<()>
+    where
+        I: IntoIterator<Item = &'a [u8]>,
+    {
+        let mut buf = Vec::new();
+        for data in records {
+            let mut hasher = Hasher::new();
+            hasher.update(data);
+            let crc = hasher.finalize();
+
+            buf.reserve(8 + data.len());
+            buf.extend_from_slice(&(data.len() as u32).to_le_bytes());
+            buf.extend_from_slice(&crc.to_le_bytes());
+            buf.extend_from_slice(data);
+        }
 
-        self.file.write_all(&len.to_le_bytes())?;
-        self.file.write_all(&crc.to_le_bytes())?;
-        self.file.write_all(data)?;
+        self.file.write_all(&buf)?;
         self.file.sync_all()?;
         Ok(())
     }
@@ -11,6 +11,14 @@ pub struct WriteBatch {
     batch_id: String,
 }
 
+/// Operation tags used by the framed batch encoding (see [`WriteBatch::from_frames`])
+pub const BATCH_OP_SET: u8 = 0;
+pub const BATCH_OP_UPDATE: u8 = 1;
+pub const BATCH_OP_DELETE: u8 = 2;
+
+/// Size of a frame header: op (u8) + path length (u32 LE) + data length (u32 LE)
+pub const BATCH_FRAME_HEADER_LEN: usize = 9;
+
 #[derive(Debug, Clone)]
 pub enum BatchOperation {
     Set { path: String, data: Vec<u8> },
@@ -55,6 +63,11 @@ impl WriteBatch {
         &self.operations
     }
 
+    /// Consume the batch, returning its operations
+    pub fn into_operations(self) -> Vec<BatchOperation> {
+        self.operations
+    }
+
     /// Get the number of operations
     pub fn len(&self) -> usize {
         self.operations.len()
@@ -64,6 +77,65 @@ impl WriteBatch {
     pub fn is_empty(&self) -> bool {
         self.operations.is_empty()
     }
+
+    /// Decode a batch from a contiguous buffer of framed operations.
+    ///
+    /// Each frame is `[op:u8][path_len:u32le][data_len:u32le][path][data]`,
+    /// letting bindings submit a whole batch in a single FFI call.
+    pub fn from_frames(buf: &[u8]) -> io::Result<Self> {
+        let mut batch = Self::new();
+        let mut offset = 0;
+
+        while offset < buf.len() {
+            if buf.len() - offset < BATCH_FRAME_HEADER_LEN {
+                return Err(io::Error::new(
+                    io::ErrorKind::InvalidData,
+                    "Truncated batch frame header",
+                ));
+            }
+            let op = buf[offset];
+            let path_len = read_u32_le(&buf[offset + 1..offset + 5]) as usize;
+            let data_len = read_u32_le(&buf[offset + 5..offset + 9]) as usize;
+            offset += BATCH_FRAME_HEADER_LEN;
+
+            let path_end = offset + path_len;
+            let data_end = path_end + data_len;
+            if data_end > buf.len() {
+                return Err(io::Error::new(
+                    io::ErrorKind::InvalidData,
+                    "Truncated batch frame body",
+                ));
+            }
+
+            let path = std::str::from_utf8(&buf[offset..path_end])
+                .map_err(|_| {
+                    io::Error::new(io::ErrorKind::InvalidData, "Batch path must be valid UTF-8")
+                })?
+                .to_string();
+            let data = &buf[path_end..data_end];
+
+            match op {
+                BATCH_OP_SET => batch.set(path, data.to_vec()),
+                BATCH_OP_UPDATE => batch.update(path, data.to_vec()),
+                BATCH_OP_DELETE => batch.delete(path),
+                _ => {
+                    return Err(io::Error::new(
+                        io::ErrorKind::InvalidData,
+                        format!("Unknown batch operation tag {}", op),
+                    ))
+                }
+            };
+            offset = data_end;
+        }
+
+        Ok(batch)
+    }
+}
+
+fn read_u32_le(bytes: &[u8]) -> u32 {
+    let mut buf = [0u8; 4];
+    buf.copy_from_slice(bytes);
+    u32::from_le_bytes(buf)
 }
 
 impl Default for WriteBatch {
@@ -246,6 +318,41 @@ mod tests {
         assert!(!batch.batch_id().is_empty());
     }
 
+    fn frame(op: u8, path: &str, data: &[u8]) -> Vec<u8> {
+        let mut out = vec![op];
+        out.extend_from_slice(&(path.len() as u32).to_le_bytes());
+        out.extend_from_slice(&(data.len() as u32).to_le_bytes());
+        out.extend_from_slice(path.as_bytes());
+        out.extend_from_slice(data);
+        out
+    }
+
+    #[test]
+    fn test_write_batch_from_frames() {
+        let mut buf = frame(BATCH_OP_SET, "users/alice", b"{\"name\":\"Alice\"}");
+        buf.extend(frame(BATCH_OP_UPDATE, "users/bob", b"{\"age\":30}"));
+        buf.extend(frame(BATCH_OP_DELETE, "users/charlie", b""));
+
+        let batch = WriteBatch::from_frames(&buf).unwrap();
+        assert_eq!(batch.len(), 3);
+        assert!(matches!(
+            &batch.operations()[0],
+            BatchOperation::Set { path, data } if path == "users/alice" && data == b"{\"name\":\"Alice\"}"
+        ));
+        assert!(
+            matches!(&batch.operations()[1], BatchOperation::Update { path, .. } if path == "users/bob")
+        );
+        assert!(
+            matches!(&batch.operations()[2], BatchOperation::Delete { path } if path == "users/charlie")
+        );
+
+        assert!(WriteBatch::from_frames(&[]).unwrap().is_empty());
+
+        // Truncated body and unknown tags are rejected
+        assert!(WriteBatch::from_frames(&buf[..buf.len() - 1]).is_err());
+        assert!(WriteBatch::from_frames(&frame(9, "users/alice", b"")).is_err());
+    }
+
     #[test]
     fn test_transaction() {
         let mut txn = Transaction::new();
@@ -1,9 +1,22 @@
 use std::ffi::{CStr, CString};
 
 use firelocal_core::ffi::{
-    firelocal_destroy, firelocal_free_string, firelocal_get_resource, firelocal_load_rules,
-    firelocal_open, firelocal_put_resource,
+    firelocal_batch_commit_ops, firelocal_compact_struct, firelocal_destroy, firelocal_free_buffer,
+    firelocal_free_string, firelocal_get_bytes, firelocal_get_field, firelocal_get_resource,
+    firelocal_get_resource_len, firelocal_load_rules, firelocal_multi_get, firelocal_multi_put,
+    firelocal_open, firelocal_put_bytes, firelocal_put_resource, CompactionStatsC,
+    MULTI_GET_MISSING,
 };
+use firelocal_core::transaction::{BATCH_OP_DELETE, BATCH_OP_SET, BATCH_OP_UPDATE};
+
+fn frame(op: u8, path: &str, data: &[u8]) -> Vec<u8> {
+    let mut out = vec![op];
+    out.extend_from_slice(&(path.len() as u32).to_le_bytes());
+    out.extend_from_slice(&(data.len() as u32).to_le_bytes());
+    out.extend_from_slice(path.as_bytes());
+    out.extend_from_slice(data);
+    out
+}
 
 #[test]
 fn test_ffi_lifecycle() {
@@ -36,6 +49,17 @@ fn test_ffi_lifecycle() {
         // 4. Free String
         firelocal_free_string(res_ptr);
 
+        // Length-returning variant
+        let mut len = 0usize;
+        let res_ptr = firelocal_get_resource_len(db_ptr, key.as_ptr(), &mut len);
+        assert!(
+            !res_ptr.is_null(),
+            "Get with length should return a pointer"
+        );
+        let bytes = std::slice::from_raw_parts(res_ptr as *const u8, len);
+        assert_eq!(bytes, br#"{"foo":"bar"}"#);
+        firelocal_free_string(res_ptr);
+
         // 5. Destroy DB
         firelocal_destroy(db_ptr);
 
@@ -43,3 +67,170 @@ fn test_ffi_lifecycle() {
         let _ = std::fs::remove_dir_all("tmp_ffi_test_db");
     }
 }
+
+#[test]
+fn test_ffi_batch_commit_ops() {
+    unsafe {
+        let path = CString::new("tmp_ffi_batch_test_db").unwrap();
+        let db_ptr = firelocal_open(path.as_ptr());
+        assert!(!db_ptr.is_null(), "Database pointer should not be null");
+
+        let mut buf = frame(BATCH_OP_SET, "users/alice", br#"{"name":"Alice"}"#);
+        buf.extend(frame(BATCH_OP_SET, "users/bob", br#"{"name":"Bob"}"#));
+        buf.extend(frame(BATCH_OP_DELETE, "users/bob", b""));
+
+        let ret = firelocal_batch_commit_ops(db_ptr, buf.as_ptr(), buf.len());
+        assert_eq!(ret, 0, "Batch commit should return 0 on success");
+
+        let key = CString::new("users/alice").unwrap();
+        let res_ptr = firelocal_get_resource(db_ptr, key.as_ptr());
+        assert!(!res_ptr.is_null(), "Committed document should be readable");
+        assert_eq!(
+            CStr::from_ptr(res_ptr).to_str().unwrap(),
+            r#"{"name":"Alice"}"#
+        );
+        firelocal_free_string(res_ptr);
+
+        let key = CString::new("users/bob").unwrap();
+        assert!(firelocal_get_resource(db_ptr, key.as_ptr()).is_null());
+
+        // Multi-get returns documents in key order, marking missing ones
+        let mut keys = Vec::new();
+        for key in ["users/alice", "users/bob"] {
+            keys.extend_from_slice(&(key.len() as u32).to_le_bytes());
+            keys.extend_from_slice(key.as_bytes());
+        }
+        let mut out_len = 0usize;
+        let out_ptr = firelocal_multi_get(db_ptr, keys.as_ptr(), keys.len(), &mut out_len);
+        assert!(!out_ptr.is_null(), "Multi-get should return a buffer");
+        let out = std::slice::from_raw_parts(out_ptr, out_len);
+        let alice = br#"{"name":"Alice"}"#;
+        let mut expected = (alice.len() as u32).to_le_bytes().to_vec();
+        expected.extend_from_slice(alice);
+        expected.extend_from_slice(&MULTI_GET_MISSING.to_le_bytes());
+        assert_eq!(out, &expected[..]);
+        firelocal_free_buffer(out_ptr, out_len);
+
+        // Malformed frames are rejected
+        let ret = firelocal_batch_commit_ops(db_ptr, buf.as_ptr(), buf.len() - 1);
+        assert_eq!(ret, -1, "Truncated batch should fail");
+
+        let mut stats = CompactionStatsC::default();
+        assert_eq!(firelocal_compact_struct(db_ptr, &mut stats), 0);
+        assert!(stats.size_after <= stats.size_before);
+
+        firelocal_destroy(db_ptr);
+        let _ = std::fs::remove_dir_all("tmp_ffi_batch_test_db");
+    }
+}
+
+#[test]
+fn test_ffi_multi_put() {
+    unsafe {
+        let path = CString::new("tmp_ffi_multi_put_test_db").unwrap();
+        let db_ptr = firelocal_open(path.as_ptr());
+        assert!(!db_ptr.is_null(), "Database pointer should not be null");
+
+        let mut buf = frame(BATCH_OP_SET, "users/alice", br#"{"name":"Alice"}"#);
+        buf.extend(frame(BATCH_OP_SET, "users/bob", br#"{"name":"Bob"}"#));
+
+        let ret = firelocal_multi_put(db_ptr, buf.as_ptr(), buf.len(), 2);
+        assert_eq!(ret, 0, "Multi-put should return 0 on success");
+
+        for (key, expected) in [
+            ("users/alice", r#"{"name":"Alice"}"#),
+            ("users/bob", r#"{"name":"Bob"}"#),
+        ] {
+            let key = CString::new(key).unwrap();
+            let res_ptr = firelocal_get_resource(db_ptr, key.as_ptr());
+            assert!(!res_ptr.is_null(), "Written document should be readable");
+            assert_eq!(CStr::from_ptr(res_ptr).to_str().unwrap(), expected);
+            firelocal_free_string(res_ptr);
+        }
+
+        // A count that does not match the frames is rejected
+        let ret = firelocal_multi_put(db_ptr, buf.as_ptr(), buf.len(), 3);
+        assert_eq!(ret, -1, "Mismatched count should fail");
+
+        // Only set frames are accepted
+        let update = frame(BATCH_OP_UPDATE, "users/carol", br#"{"name":"Carol"}"#);
+        let ret = firelocal_multi_put(db_ptr, update.as_ptr(), update.len(), 1);
+        assert_eq!(ret, -1, "Non-set frames should fail");
+
+        firelocal_destroy(db_ptr);
+        let _ = std::fs::remove_dir_all("tmp_ffi_multi_put_test_db");
+    }
+}
+
+#[test]
+fn test_ffi_put_get_bytes() {
+    unsafe {
+        let path = CString::new("tmp_ffi_bytes_test_db").unwrap();
+        let db_ptr = firelocal_open(path.as_ptr());
+        assert!(!db_ptr.is_null(), "Database pointer should not be null");
+
+        // Opaque values may contain NUL and invalid UTF-8
+        let key = CString::new("blobs/one").unwrap();
+        let blob = [0u8, 159, 146, 150, 0, 42];
+        let ret = firelocal_put_bytes(db_ptr, key.as_ptr(), blob.as_ptr(), blob.len());
+        assert_eq!(ret, 0, "Put bytes should return 0 on success");
+
+        let mut out_len = 0usize;
+        let out_ptr = firelocal_get_bytes(db_ptr, key.as_ptr(), &mut out_len);
+        assert!(!out_ptr.is_null(), "Stored blob should be readable");
+        assert_eq!(std::slice::from_raw_parts(out_ptr, out_len), &blob[..]);
+        firelocal_free_buffer(out_ptr, out_len);
+
+        let missing = CString::new("blobs/missing").unwrap();
+        assert!(firelocal_get_bytes(db_ptr, missing.as_ptr(), &mut out_len).is_null());
+
+        firelocal_destroy(db_ptr);
+        let _ = std::fs::remove_dir_all("tmp_ffi_bytes_test_db");
+    }
+}
+
+#[test]
+fn test_ffi_get_field() {
+    unsafe {
+        let path = CString::new("tmp_ffi_field_test_db").unwrap();
+        let db_ptr = firelocal_open(path.as_ptr());
+        assert!(!db_ptr.is_null(), "Database pointer should not be null");
+
+        let key = CString::new("users/alice").unwrap();
+        let val = CString::new(r#"{"user":{"profile":{"name":"Alice"}}}"#).unwrap();
+        assert_eq!(
+            firelocal_put_resource(db_ptr, key.as_ptr(), val.as_ptr()),
+            0
+        );
+
+        let mut field = Vec::new();
+        for segment in ["user", "profile", "name"] {
+            field.extend_from_slice(&(segment.len() as u32).to_le_bytes());
+            field.extend_from_slice(segment.as_bytes());
+        }
+        let mut out_len = 0usize;
+        let out_ptr = firelocal_get_field(
+            db_ptr,
+            key.as_ptr(),
+            field.as_ptr(),
+            field.len(),
+            &mut out_len,
+        );
+        assert!(!out_ptr.is_null(), "Existing field should be returned");
+        assert_eq!(std::slice::from_raw_parts(out_ptr, out_len), br#""Alice""#);
+        firelocal_free_buffer(out_ptr, out_len);
+
+        // Truncated paths are rejected
+        let out_ptr = firelocal_get_field(
+            db_ptr,
+            key.as_ptr(),
+            field.as_ptr(),
+            field.len() - 1,
+            &mut out_len,
+        );
+        assert!(out_ptr.is_null(), "Truncated path should fail");
+
+        firelocal_destroy(db_ptr);
+        let _ = std::fs::remove_dir_all("tmp_ffi_field_test_db");
+    }
+}
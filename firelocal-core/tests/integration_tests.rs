@@ -284,3 +284,47 @@ fn test_special_characters_in_path() {
     // Cleanup
     let _ = fs::remove_dir_all(test_dir);
 }
+
+#[test]
+fn test_get_field() {
+    let test_dir = "test_db_get_field";
+    let _ = fs::remove_dir_all(test_dir);
+    fs::create_dir_all(test_dir).unwrap();
+
+    let mut db = FireLocal::new(test_dir).expect("Failed to create database");
+
+    let value = br#"{"user":{"profile":{"name":"Alice","tags":["a","b"]}}}"#.to_vec();
+    db.put("users/alice".to_string(), value)
+        .expect("Failed to put document");
+
+    // Nested object fields are returned as JSON
+    let name = db
+        .get_field("users/alice", &["user", "profile", "name"])
+        .expect("Failed to get field");
+    assert_eq!(name, Some(br#""Alice""#.to_vec()));
+
+    // Numeric segments index into arrays
+    let tag = db
+        .get_field("users/alice", &["user", "profile", "tags", "1"])
+        .expect("Failed to get field");
+    assert_eq!(tag, Some(br#""b""#.to_vec()));
+
+    // An empty path returns the whole document
+    let doc = db
+        .get_field::<&str>("users/alice", &[])
+        .expect("Failed to get field");
+    assert!(doc.is_some(), "Empty path should return the document");
+
+    // Missing fields and documents are None
+    assert!(db
+        .get_field("users/alice", &["user", "email"])
+        .expect("Failed to get field")
+        .is_none());
+    assert!(db
+        .get_field("users/bob", &["user"])
+        .expect("Failed to get field")
+        .is_none());
+
+    // Cleanup
+    let _ = fs::remove_dir_all(test_dir);
+}
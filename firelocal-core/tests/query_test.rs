@@ -78,3 +78,52 @@ fn test_query_indexing() {
 
     let _ = fs::remove_dir_all(path);
 }
+
+#[test]
+fn test_put_bytes_not_indexed() {
+    let path = "tmp_test_db_query_bytes";
+    let _ = fs::remove_dir_all(path);
+
+    let doc = json!({
+        "path": "users/dave",
+        "fields": {
+            "name": "Dave",
+            "active": true
+        }
+    });
+    let erin = json!({
+        "path": "users/erin",
+        "fields": {
+            "name": "Erin",
+            "active": true
+        }
+    });
+    let q = QueryAst {
+        collection: Some("users".to_string()),
+        field: "active".to_string(),
+        operator: QueryOperator::Equal(json!(true)),
+    };
+
+    {
+        let mut db = FireLocal::new(path).unwrap();
+        db.put_bytes("users/dave".to_string(), serde_json::to_vec(&doc).unwrap())
+            .unwrap();
+        assert!(db.query(&q).unwrap().is_empty());
+
+        // Overwriting an indexed document with a blob removes its index entries
+        db.put("users/erin".to_string(), serde_json::to_vec(&erin).unwrap())
+            .unwrap();
+        assert_eq!(db.query(&q).unwrap().len(), 1);
+        let blob = json!({"path": "users/erin", "fields": {"active": false}});
+        db.put_bytes("users/erin".to_string(), serde_json::to_vec(&blob).unwrap())
+            .unwrap();
+        assert!(db.query(&q).unwrap().is_empty());
+    }
+
+    // Replay keeps the value but still skips indexing it
+    let db = FireLocal::new(path).unwrap();
+    assert!(db.get("users/dave").unwrap().is_some());
+    assert!(db.query(&q).unwrap().is_empty());
+
+    let _ = fs::remove_dir_all(path);
+}